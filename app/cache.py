@@ -54,7 +54,7 @@ class SimpleCache:
         # Create a deterministic string from args and kwargs
         key_data = {"args": args, "kwargs": sorted(kwargs.items())}
         key_string = json.dumps(key_data, sort_keys=True, default=str)
-        return hashlib.md5(key_string.encode()).hexdigest()
+        return hashlib.blake2b(key_string.encode(), digest_size=16).hexdigest()
 
     def _cleanup_expired(self):
         """Remove expired entries from cache"""
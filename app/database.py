@@ -1,5 +1,7 @@
-from sqlalchemy import create_engine, event
-from sqlalchemy.orm import sessionmaker
+from contextlib import contextmanager
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 import os
 from pathlib import Path
@@ -134,6 +136,53 @@ def init_db():
         db.close()
 
 
+# SQLite settings for long-running bulk write jobs: WAL with NORMAL sync only
+# fsyncs at checkpoints instead of twice per commit
+BULK_WRITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "temp_store": "MEMORY",
+    "cache_size": "-65536",  # 64MB
+}
+
+
+@contextmanager
+def bulk_write_pragmas(db: Session, pragmas: dict = None):
+    """
+    Temporarily tune SQLite for bulk writes, restoring previous settings on exit
+
+    Does nothing for other databases. Settings that cannot be changed (for
+    example journal_mode inside an open write transaction) are skipped.
+
+    Args:
+        db: Database session to tune
+        pragmas: Pragma names mapped to values (defaults to BULK_WRITE_PRAGMAS)
+    """
+    if db.get_bind().dialect.name != "sqlite":
+        yield
+        return
+
+    previous = {}
+    for name, value in (pragmas or BULK_WRITE_PRAGMAS).items():
+        try:
+            current = db.execute(text(f"PRAGMA {name}")).scalar()
+            db.execute(text(f"PRAGMA {name}={value}"))
+            previous[name] = current
+        except OperationalError as e:
+            logger.warning(f"Could not set PRAGMA {name}={value}: {e}")
+
+    logger.debug(f"SQLite bulk write pragmas enabled: {list(previous)}")
+
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            try:
+                db.execute(text(f"PRAGMA {name}={value}"))
+            except OperationalError as e:
+                logger.warning(f"Could not restore PRAGMA {name}={value}: {e}")
+
+
 def get_db_info():
     """Get information about the current database"""
     if DATABASE_URL.startswith("sqlite:///"):
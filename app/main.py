@@ -4,8 +4,9 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.staticfiles import StaticFiles
 import logging
 import os
+import re
 import asyncio
-from .database import create_tables, init_db
+from .database import init_db
 from .exceptions import TracklistException
 from .logging_config import setup_logging
 from .routers import search, albums, templates, reports, settings
@@ -21,6 +22,10 @@ setup_logging(level=log_level, log_file=log_file)
 
 logger = logging.getLogger(__name__)
 
+# Genres stored as release country codes (2-3 uppercase letters, e.g. XWW for
+# worldwide) are data errors left by older imports
+COUNTRY_CODE_PATTERN = re.compile(r"^[A-Z]{2,3}$")
+
 # Create FastAPI app
 app = FastAPI(
     title="Tracklist API",
@@ -157,9 +162,11 @@ async def auto_migrate_artwork_cache():
             # Process albums in batches to avoid overwhelming the system
             batch_size = int(os.getenv("MIGRATION_BATCH_SIZE", "10"))
             max_albums = int(os.getenv("MIGRATION_MAX_ALBUMS", "0"))  # 0 = no limit
+            batch_delay = float(os.getenv("MIGRATION_BATCH_DELAY", "2"))  # seconds
 
             # Get albums to process - those without cache entries
-            query = db.query(Album).filter(
+            # Only the ID and URL are needed to queue each album
+            query = db.query(Album.id, Album.cover_art_url).filter(
                 ~has_cache,
                 Album.cover_art_url.isnot(None),  # Only process albums with URLs
             )
@@ -187,7 +194,8 @@ async def auto_migrate_artwork_cache():
 
                     # Add delay between batches to avoid overwhelming
                     if (i + 1) % batch_size == 0:
-                        await asyncio.sleep(2)  # Wait 2 seconds between batches
+                        if batch_delay > 0:
+                            await asyncio.sleep(batch_delay)
                         logger.info(
                             f"Queued {queued}/{len(albums)} albums for caching..."
                         )
@@ -230,15 +238,10 @@ async def fix_genre_country_codes():
         from .models import Album
         from .musicbrainz_client import MusicBrainzClient
         from sqlalchemy import or_, and_
-        import re
 
         db = SessionLocal()
 
         try:
-            # Find albums with NULL genre or country code pattern (2-3 uppercase letters)
-            # Country codes are typically 2 letters, but some special codes are 3 (like XWW for worldwide)
-            country_code_pattern = re.compile(r"^[A-Z]{2,3}$")
-
             # Get all albums to check
             all_albums = db.query(Album).all()
             albums_to_fix = []
@@ -246,7 +249,7 @@ async def fix_genre_country_codes():
             for album in all_albums:
                 if album.genre is None:
                     albums_to_fix.append(album)
-                elif country_code_pattern.match(album.genre):
+                elif COUNTRY_CODE_PATTERN.match(album.genre):
                     albums_to_fix.append(album)
 
             if not albums_to_fix:
@@ -339,8 +342,7 @@ async def startup_event():
     """Initialize database, cache directories, and background tasks on startup"""
     logger.info("Starting Tracklist application...")
     try:
-        # Initialize database
-        create_tables()
+        # Initialize database (init_db creates the tables itself)
         init_db()
         logger.info("Database initialized successfully")
 
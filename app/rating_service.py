@@ -5,6 +5,8 @@ Handles album creation, track rating, and score calculation
 
 from typing import Dict, List, Optional, Any
 from sqlalchemy.orm import Session
+from sqlalchemy import or_
+import asyncio
 import logging
 from datetime import datetime, timezone
 
@@ -77,6 +79,9 @@ class RatingCalculator:
 class RatingService:
     """Service for album rating operations"""
 
+    # Concurrent Cover Art Archive lookups when backfilling missing artwork
+    COVER_ART_CONCURRENCY = 5
+
     def __init__(self):
         self.musicbrainz_service = get_musicbrainz_service()
 
@@ -439,6 +444,11 @@ class RatingService:
         # Get paginated results
         albums = query.offset(offset).limit(limit).all()
 
+        # Resolve artwork for the whole page with one query
+        from .template_utils import prefetch_artwork_urls
+
+        prefetch_artwork_urls(albums, size="large")
+
         return {
             "albums": [self._format_album_summary(album) for album in albums],
             "total": total,
@@ -451,17 +461,20 @@ class RatingService:
         self, name: str, musicbrainz_id: Optional[str], db: Session
     ) -> Artist:
         """Create or get existing artist"""
+        # Look up MusicBrainz ID and name candidates in a single query
+        criteria = [Artist.name == name]
         if musicbrainz_id:
-            artist = (
-                db.query(Artist).filter(Artist.musicbrainz_id == musicbrainz_id).first()
-            )
-            if artist:
-                return artist
+            criteria.append(Artist.musicbrainz_id == musicbrainz_id)
+
+        candidates = db.query(Artist).filter(or_(*criteria)).order_by(Artist.id).all()
 
-        # Check by name if no MusicBrainz ID match
-        artist = db.query(Artist).filter(Artist.name == name).first()
-        if artist:
-            return artist
+        # Prefer a MusicBrainz ID match, then fall back to a name match
+        for artist in candidates:
+            if musicbrainz_id and artist.musicbrainz_id == musicbrainz_id:
+                return artist
+        for artist in candidates:
+            if artist.name == name:
+                return artist
 
         # Create new artist
         artist = Artist(name=name, musicbrainz_id=musicbrainz_id)
@@ -745,13 +758,25 @@ class RatingService:
             updated_count = 0
             failed_count = 0
 
-            for album in albums_without_art:
-                try:
-                    # Fetch cover art URL
-                    cover_art_url = await cover_art_service.get_cover_art_url(
+            # Fetch cover art URLs concurrently, bounded to stay polite to the API
+            semaphore = asyncio.Semaphore(self.COVER_ART_CONCURRENCY)
+
+            async def fetch_cover_art_url(album: Album) -> Optional[str]:
+                async with semaphore:
+                    return await cover_art_service.get_cover_art_url(
                         album.musicbrainz_id
                     )
 
+            cover_art_urls = await asyncio.gather(
+                *[fetch_cover_art_url(album) for album in albums_without_art],
+                return_exceptions=True,
+            )
+
+            for album, cover_art_url in zip(albums_without_art, cover_art_urls):
+                try:
+                    if isinstance(cover_art_url, Exception):
+                        raise cover_art_url
+
                     if cover_art_url:
                         album.cover_art_url = cover_art_url
                         db.add(album)
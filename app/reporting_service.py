@@ -4,8 +4,9 @@ Provides endpoints for retrieving album statistics and analytics
 """
 
 from typing import Dict, Any, Optional, List
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import func, and_, select
+from itertools import groupby
 import logging
 import random
 from datetime import datetime
@@ -20,6 +21,9 @@ logger = logging.getLogger(__name__)
 class ReportingService:
     """Service for generating user statistics and reports"""
 
+    # Rows fetched per round trip when streaming large result sets
+    STREAM_BATCH_SIZE = 1000
+
     def __init__(self):
         """Initialize reporting service with cache"""
         self.cache = SimpleCache(
@@ -103,23 +107,24 @@ class ReportingService:
             Dict with rating values as keys and counts as values
         """
         try:
-            distribution = {
-                "skip": 0,  # 0.0
-                "filler": 0,  # 0.33
-                "good": 0,  # 0.67
-                "standout": 0,  # 1.0
+            rating_labels = {
+                0.0: "skip",
+                0.33: "filler",
+                0.67: "good",
+                1.0: "standout",
             }
+            distribution = {label: 0 for label in rating_labels.values()}
 
-            # Query for each rating value
-            skip_count = db.query(Track).filter(Track.track_rating == 0.0).count()
-            filler_count = db.query(Track).filter(Track.track_rating == 0.33).count()
-            good_count = db.query(Track).filter(Track.track_rating == 0.67).count()
-            standout_count = db.query(Track).filter(Track.track_rating == 1.0).count()
+            # Count every rating value in a single grouped query
+            rating_counts = (
+                db.query(Track.track_rating, func.count(Track.id))
+                .filter(Track.track_rating.in_(list(rating_labels)))
+                .group_by(Track.track_rating)
+                .all()
+            )
 
-            distribution["skip"] = skip_count
-            distribution["filler"] = filler_count
-            distribution["good"] = good_count
-            distribution["standout"] = standout_count
+            for rating, count in rating_counts:
+                distribution[rating_labels[rating]] = count
 
             return distribution
 
@@ -145,6 +150,7 @@ class ReportingService:
             recently_rated = (
                 db.query(Album)
                 .filter(Album.is_rated == True)
+                .options(selectinload(Album.artist))
                 .order_by(Album.rated_at.desc())
                 .limit(limit)
                 .all()
@@ -155,6 +161,7 @@ class ReportingService:
                 db.query(Album)
                 .join(Track)
                 .filter(Album.is_rated == False, Track.track_rating.isnot(None))
+                .options(selectinload(Album.artist), selectinload(Album.tracks))
                 .order_by(Album.updated_at.desc())
                 .distinct()
                 .limit(limit)
@@ -241,6 +248,7 @@ class ReportingService:
                 top_album_pool = (
                     db.query(Album)
                     .filter(Album.is_rated == True)
+                    .options(selectinload(Album.artist))
                     .order_by(Album.rating_score.desc())
                     .limit(pool_size)
                     .all()
@@ -260,6 +268,7 @@ class ReportingService:
                 selected_albums = (
                     db.query(Album)
                     .filter(Album.is_rated == True)
+                    .options(selectinload(Album.artist))
                     .order_by(Album.rating_score.desc())
                     .limit(limit)
                     .all()
@@ -445,47 +454,65 @@ class ReportingService:
                 return cached_result
 
         try:
-            # Get fully rated albums with their tracks eagerly loaded to avoid N+1 queries
-            from sqlalchemy.orm import joinedload
-
-            fully_rated_albums = (
-                db.query(Album)
-                .filter(Album.is_rated == True)
-                .options(joinedload(Album.tracks))
-                .options(joinedload(Album.artist))
-                .all()
+            total_rated = (
+                db.query(func.count(Album.id)).filter(Album.is_rated == True).scalar()
             )
 
-            no_skip_albums = []
+            # Stream track ratings for rated albums in album order and group them
+            # in Python instead of materialising every album with its tracks
+            rating_rows = db.execute(
+                select(Track.album_id, Album.rating_score, Track.track_rating)
+                .join(Album, Album.id == Track.album_id)
+                .where(Album.is_rated == True)
+                .order_by(Track.album_id)
+                .execution_options(yield_per=self.STREAM_BATCH_SIZE)
+            )
 
-            for album in fully_rated_albums:
+            no_skip_scores = {}
+            for album_id, album_rows in groupby(rating_rows, key=lambda r: r.album_id):
+                album_rows = list(album_rows)
                 # Check if all tracks have rating >= 0.67 (Good or Standout)
                 has_skips = any(
-                    track.track_rating is not None and track.track_rating < 0.67
-                    for track in album.tracks
+                    row.track_rating is not None and row.track_rating < 0.67
+                    for row in album_rows
                 )
+                if not has_skips:
+                    no_skip_scores[album_id] = album_rows[0].rating_score
 
-                if not has_skips and album.tracks:  # Ensure album has tracks
-                    no_skip_albums.append(album)
+            no_skip_ids = list(no_skip_scores)
 
             # Store total count before limiting
-            total_no_skip_count = len(no_skip_albums)
+            total_no_skip_count = len(no_skip_ids)
 
             # Randomize or sort by score
-            if randomize and limit and len(no_skip_albums) > limit:
+            if randomize and limit and len(no_skip_ids) > limit:
                 # Randomly select albums when limit is specified
-                no_skip_albums = random.sample(no_skip_albums, limit)
+                no_skip_ids = random.sample(no_skip_ids, limit)
                 # Then sort the random selection by score for display
-                no_skip_albums.sort(key=lambda x: x.rating_score or 0, reverse=True)
+                no_skip_ids.sort(key=lambda x: no_skip_scores[x] or 0, reverse=True)
             else:
                 # Sort by rating score descending
-                no_skip_albums.sort(key=lambda x: x.rating_score or 0, reverse=True)
+                no_skip_ids.sort(key=lambda x: no_skip_scores[x] or 0, reverse=True)
                 # Apply limit if specified
                 if limit:
-                    no_skip_albums = no_skip_albums[:limit]
+                    no_skip_ids = no_skip_ids[:limit]
+
+            # Load full details only for the albums being returned
+            albums_by_id = {
+                album.id: album
+                for album in db.query(Album)
+                .filter(Album.id.in_(no_skip_ids))
+                .options(selectinload(Album.tracks), selectinload(Album.artist))
+                .all()
+            }
+            no_skip_albums = [albums_by_id[album_id] for album_id in no_skip_ids]
+
+            # Resolve artwork for every returned album with one query
+            from .template_utils import prefetch_artwork_urls
+
+            prefetch_artwork_urls(no_skip_albums, size="large")
 
             # Calculate percentage
-            total_rated = len(fully_rated_albums)
             percentage = (
                 round((total_no_skip_count / total_rated) * 100, 1)
                 if total_rated > 0
@@ -568,6 +595,7 @@ class ReportingService:
                 worst_album_pool = (
                     db.query(Album)
                     .filter(Album.is_rated == True)
+                    .options(selectinload(Album.artist))
                     .order_by(Album.rating_score.asc())
                     .limit(pool_size)
                     .all()
@@ -585,6 +613,7 @@ class ReportingService:
                 selected_albums = (
                     db.query(Album)
                     .filter(Album.is_rated == True)
+                    .options(selectinload(Album.artist))
                     .order_by(Album.rating_score.asc())
                     .limit(limit)
                     .all()
@@ -737,7 +766,9 @@ class ReportingService:
             total_albums_in_year = albums_query.count()
 
             # Apply limit for the actual results
-            top_albums = albums_query.limit(limit).all()
+            top_albums = (
+                albums_query.options(selectinload(Album.artist)).limit(limit).all()
+            )
 
             # Also get count of rated albums in this year
             rated_albums_in_year = (
@@ -19,6 +19,14 @@ from ..services.export_service import get_export_service, ExportService
 
 logger = logging.getLogger(__name__)
 
+# Prefer orjson for parsing uploaded backups, fallback to stdlib json
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 router = APIRouter(prefix="/api/v1/settings", tags=["settings"])
 
 
@@ -312,10 +320,13 @@ async def import_database(
                 detail="Invalid file type. Please upload a JSON backup file.",
             )
 
-        # Read and parse JSON
+        # Read and parse JSON directly from the uploaded bytes
         content = await file.read()
         try:
-            backup_data = json.loads(content)
+            if ORJSON_AVAILABLE:
+                backup_data = orjson.loads(content)
+            else:
+                backup_data = json.loads(content)
         except json.JSONDecodeError as e:
             raise HTTPException(status_code=400, detail=f"Invalid JSON file: {str(e)}")
 
@@ -4,7 +4,7 @@ Handles non-blocking artwork downloads and processing
 """
 
 import logging
-import asyncio
+import time
 from typing import Optional, Dict, Any
 from sqlalchemy.orm import Session
 
@@ -56,7 +56,7 @@ class ArtworkCacheBackgroundService:
         # Mark as processing
         self._cache_status[album_id] = {
             "status": "processing",
-            "started_at": asyncio.get_event_loop().time(),
+            "started_at": time.monotonic(),
         }
 
         # Add task to background queue
@@ -197,19 +197,19 @@ class ArtworkCacheBackgroundService:
         db = SessionLocal()
         try:
             # Find albums without cached artwork
-            albums_to_cache = (
-                db.query(Album)
+            # Only IDs are needed here, each task loads its own album
+            album_ids = [
+                row.id
+                for row in db.query(Album.id)
                 .filter(Album.artwork_cached == False, Album.cover_art_url.isnot(None))
                 .limit(batch_size)
-                .all()
-            )
+            ]
 
-            if not albums_to_cache:
+            if not album_ids:
                 logger.info("No albums need artwork caching")
                 return {"queued": 0, "albums": []}
 
             # Queue caching for each album
-            album_ids = [album.id for album in albums_to_cache]
             task_map = await self.cache_multiple_albums(album_ids, priority=priority)
 
             return {"queued": len(task_map), "albums": album_ids, "tasks": task_map}
@@ -33,6 +33,14 @@ except ImportError:
     HTTPX_AVAILABLE = False
     logger.warning("httpx not available - artwork caching will be limited")
 
+# HTTP/2 support requires the optional h2 package
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
 class ArtworkCacheError(TracklistException):
     """Exception raised for artwork cache operations"""
@@ -53,6 +61,8 @@ class ArtworkCacheService:
 
     # Cache settings
     CACHE_TIMEOUT = 30  # seconds for download timeout
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    MAX_CONNECTIONS = 50
 
     def __init__(self, cache_fs: Optional[ArtworkCacheFileSystem] = None):
         """
@@ -65,18 +75,26 @@ class ArtworkCacheService:
         self.cover_art_service = get_cover_art_service()
         self.image_processor = get_image_processor()
 
-        # Use the enhanced downloader with retry and rate limiting
+        # Use the enhanced downloader with retry and rate limiting. The client
+        # lives as long as the service so batch runs reuse pooled connections
         if HTTPX_AVAILABLE:
             self.client = httpx.AsyncClient(
                 timeout=self.CACHE_TIMEOUT,
                 follow_redirects=True,
-                limits=httpx.Limits(max_keepalive_connections=5),
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                    max_connections=self.MAX_CONNECTIONS,
+                ),
             )
             self.downloader = ArtworkDownloader(self.client)
         else:
             self.client = None
             self.downloader = None
 
+        # Downloads in progress keyed by URL, shared by concurrent callers
+        self._inflight_downloads: Dict[str, asyncio.Future] = {}
+
         # Service initialized - logging moved to singleton creation
 
     def generate_cache_key(self, album: Album) -> str:
@@ -189,7 +207,7 @@ class ArtworkCacheService:
 
         try:
             cache_key = self.generate_cache_key(album)
-            logger.info(f"Downloading artwork for album {album.id} from {artwork_url}")
+            logger.debug(f"Downloading artwork for album {album.id} from {artwork_url}")
 
             # Download the image with metadata
             download_result = await self._download_image(artwork_url)
@@ -212,12 +230,12 @@ class ArtworkCacheService:
                 album, cache_key, artwork_url, variants_metadata, db, metadata
             )
 
-            # Update album cache status
+            # Update album cache status in the same transaction as the records
             album.artwork_cached = True
             album.artwork_cache_date = datetime.now(timezone.utc)
             db.commit()
 
-            logger.info(
+            logger.debug(
                 f"Successfully cached artwork for album {album.id} with {len(variants_metadata)} variants"
             )
             return True
@@ -228,6 +246,50 @@ class ArtworkCacheService:
             return False
 
     async def _download_image(self, url: str) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        """
+        Download image from URL, coalescing concurrent requests for the same URL
+
+        Albums sharing a cover URL (reissues, compilations) wait on a single
+        download instead of fetching the same image in parallel.
+
+        Args:
+            url: URL to download from
+
+        Returns:
+            Tuple of (image_data, metadata) or None if failed
+        """
+        inflight = self._inflight_downloads.get(url)
+        if inflight is not None:
+            logger.debug(f"Joining in-flight download for {url}")
+            try:
+                result = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The task that owned the download was cancelled, fetch directly
+                result = await self._fetch_image(url)
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight_downloads[url] = future
+            try:
+                result = await self._fetch_image(url)
+                future.set_result(result)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception:
+                future.set_result(None)
+                raise
+            finally:
+                del self._inflight_downloads[url]
+
+        if result is None:
+            return None
+
+        image_data, metadata = result
+        return image_data, dict(metadata)
+
+    async def _fetch_image(self, url: str) -> Optional[Tuple[bytes, Dict[str, Any]]]:
         """
         Download image from URL with enhanced validation and retry logic
 
@@ -263,7 +325,7 @@ class ArtworkCacheService:
         # Use enhanced downloader with retry and validation
         try:
             image_data, metadata = await self.downloader.download_with_retry(url)
-            logger.info(
+            logger.debug(
                 f"Successfully downloaded artwork from {url} ({metadata.get('content_length', 0)} bytes)"
             )
             return image_data, metadata
@@ -321,9 +383,10 @@ class ArtworkCacheService:
         variants_metadata = {}
 
         try:
-            # Process all variants using the image processor
-            processed_variants = self.image_processor.process_all_variants(
-                image_data, optimize=True
+            # Process all variants in a worker thread so decoding and resizing
+            # don't block downloads running on the event loop
+            processed_variants = await asyncio.to_thread(
+                self.image_processor.process_all_variants, image_data, optimize=True
             )
 
             # Save each processed variant and collect metadata
@@ -360,7 +423,7 @@ class ArtworkCacheService:
             # Log processing statistics
             if variants_metadata:
                 stats = self.image_processor.get_processing_stats()
-                logger.info(
+                logger.debug(
                     f"Image processing complete: {len(variants_metadata)} variants, "
                     f"{stats['mb_saved']}MB saved"
                 )
@@ -398,9 +461,9 @@ class ArtworkCacheService:
         processing_errors = []
 
         try:
-            # Process all variants using the image processor
-            processed_variants = self.image_processor.process_all_variants(
-                image_data, optimize=True
+            # Process all variants off the event loop
+            processed_variants = await asyncio.to_thread(
+                self.image_processor.process_all_variants, image_data, optimize=True
             )
 
             # Save each processed variant
@@ -434,7 +497,7 @@ class ArtworkCacheService:
 
             # Log processing statistics
             stats = self.image_processor.get_processing_stats()
-            logger.info(
+            logger.debug(
                 f"Image processing complete: {len(variants_created)} variants created, "
                 f"{stats['mb_saved']}MB saved through optimization"
             )
@@ -493,7 +556,8 @@ class ArtworkCacheService:
 
             # Process using image processor
             try:
-                processed_data, metadata = self.image_processor.process_image(
+                processed_data, metadata = await asyncio.to_thread(
+                    self.image_processor.process_image,
                     original_data,
                     size_variant,
                     optimize=True,
@@ -549,13 +613,15 @@ class ArtworkCacheService:
         try:
             now = datetime.now(timezone.utc)
 
+            # Load existing records for the album once rather than per variant
+            existing_records = {
+                record.size_variant: record
+                for record in db.query(ArtworkCache).filter_by(album_id=album.id)
+            }
+
             for variant_name, variant_meta in variants_metadata.items():
                 # Check if record exists
-                cache_record = (
-                    db.query(ArtworkCache)
-                    .filter_by(album_id=album.id, size_variant=variant_name)
-                    .first()
-                )
+                cache_record = existing_records.get(variant_name)
 
                 if not cache_record:
                     # Create new record
@@ -600,8 +666,9 @@ class ArtworkCacheService:
                     f"{cache_record.file_size_bytes} bytes"
                 )
 
-            db.commit()
-            logger.info(
+            # Flushed only; the caller commits together with the album status
+            db.flush()
+            logger.debug(
                 f"Updated {len(variants_metadata)} cache records for album {album.id}"
             )
 
@@ -633,13 +700,15 @@ class ArtworkCacheService:
         try:
             now = datetime.now(timezone.utc)
 
+            # Load existing records for the album once rather than per variant
+            existing_records = {
+                record.size_variant: record
+                for record in db.query(ArtworkCache).filter_by(album_id=album.id)
+            }
+
             for variant in variants_created:
                 # Check if record exists
-                cache_record = (
-                    db.query(ArtworkCache)
-                    .filter_by(album_id=album.id, size_variant=variant)
-                    .first()
-                )
+                cache_record = existing_records.get(variant)
 
                 if not cache_record:
                     # Create new record
@@ -817,27 +886,31 @@ class ArtworkCacheService:
             Dict with deletion statistics
         """
         try:
-            # Get cache records before deletion
-            cache_records = db.query(ArtworkCache).filter_by(album_id=album_id).all()
+            # Only the file paths are needed, so skip building ORM instances
+            cache_records = (
+                db.query(ArtworkCache.file_path)
+                .filter(ArtworkCache.album_id == album_id)
+                .all()
+            )
 
             files_deleted = 0
             bytes_freed = 0
 
             # Delete physical files
-            for record in cache_records:
-                if record.file_path:
-                    file_path = Path(record.file_path)
-                    if file_path.exists():
-                        try:
-                            file_size = file_path.stat().st_size
-                            file_path.unlink()
-                            files_deleted += 1
-                            bytes_freed += file_size
-                            logger.debug(f"Deleted cache file: {file_path}")
-                        except Exception as e:
-                            logger.warning(
-                                f"Failed to delete cache file {file_path}: {e}"
-                            )
+            for (record_path,) in cache_records:
+                if record_path:
+                    file_path = Path(record_path)
+                    try:
+                        # stat() doubles as the existence check
+                        file_size = file_path.stat().st_size
+                        file_path.unlink()
+                        files_deleted += 1
+                        bytes_freed += file_size
+                        logger.debug(f"Deleted cache file: {file_path}")
+                    except FileNotFoundError:
+                        continue
+                    except Exception as e:
+                        logger.warning(f"Failed to delete cache file {file_path}: {e}")
 
             # Delete database records
             records_count = len(cache_records)
@@ -4,10 +4,12 @@ Validates and corrects artwork_cached flags on startup
 """
 
 import logging
-from typing import Dict, Any, List
-from pathlib import Path
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Set
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, update
 
 from ..models import Album, ArtworkCache
 from ..database import SessionLocal
@@ -21,6 +23,12 @@ class ArtworkCacheValidator:
     Ensures artwork_cached is only True when local files actually exist
     """
 
+    # Album IDs per UPDATE or IN query, below SQLite's bound parameter limit
+    UPDATE_CHUNK_SIZE = 500
+
+    # Threads used to stat cache files concurrently
+    FILE_CHECK_WORKERS = 16
+
     def __init__(self):
         """Initialize the artwork cache validator"""
         self.stats = {"total_albums": 0, "correctly_marked": 0, "fixed": 0, "errors": 0}
@@ -65,10 +73,12 @@ class ArtworkCacheValidator:
             to_mark_uncached = []  # Albums marked cached but no files
             to_mark_cached = []  # Albums marked uncached but have files
 
+            # Albums with at least one cache file on disk
+            albums_with_files = self._find_albums_with_cache_files(albums, db)
+
             for album in albums:
                 try:
-                    # Check if album has actual cache files
-                    has_cache_files = self._check_cache_files_exist(album.id, db)
+                    has_cache_files = album.id in albums_with_files
 
                     if album.artwork_cached and has_cache_files:
                         # Correctly marked as cached
@@ -102,13 +112,20 @@ class ArtworkCacheValidator:
                     f"{len(to_mark_cached)} to mark as cached"
                 )
 
-                # Fix albums that should be marked as uncached
-                for album in to_mark_uncached:
-                    album.artwork_cached = False
-                    album.artwork_cache_date = None
-                    self.stats["fixed"] += 1
+                # Fix albums that should be marked as uncached with set-based
+                # updates instead of per-album dirty tracking
+                uncached_ids = [album.id for album in to_mark_uncached]
+                for i in range(0, len(uncached_ids), self.UPDATE_CHUNK_SIZE):
+                    chunk = uncached_ids[i : i + self.UPDATE_CHUNK_SIZE]
+                    db.execute(
+                        update(Album)
+                        .where(Album.id.in_(chunk))
+                        .values(artwork_cached=False, artwork_cache_date=None)
+                    )
+                self.stats["fixed"] += len(uncached_ids)
+                if uncached_ids:
                     logger.debug(
-                        f"Fixed: Set artwork_cached=False for album {album.id}"
+                        f"Fixed: Set artwork_cached=False for {len(uncached_ids)} albums"
                     )
 
                 # Fix albums that should be marked as cached
@@ -151,50 +168,64 @@ class ArtworkCacheValidator:
             if close_db:
                 db.close()
 
-    def _check_cache_files_exist(self, album_id: int, db: Session) -> bool:
+    def _find_albums_with_cache_files(
+        self, albums: List[Album], db: Session
+    ) -> Set[int]:
         """
-        Check if actual cache files exist for an album
+        Find albums that have at least one cache file on disk
+
+        Candidate paths come from ArtworkCache records plus the expected cache
+        paths for each album (to catch files whose DB records are missing).
+        All candidates are checked concurrently since each check is a stat call.
 
         Args:
-            album_id: Album ID to check
+            albums: Albums to check
             db: Database session
 
         Returns:
-            True if at least one cache file exists, False otherwise
+            Set of album IDs with existing cache files
         """
-        # Get cache records for this album
-        cache_records = (
-            db.query(ArtworkCache).filter(ArtworkCache.album_id == album_id).all()
-        )
-
-        # Check if any referenced files actually exist
-        for record in cache_records:
-            if record.file_path:
-                file_path = Path(record.file_path)
-                if file_path.exists():
-                    return True
-
-        # Also check for orphaned files (files without DB records)
-        # This handles edge cases where DB records are missing but files exist
         from .artwork_cache_utils import get_cache_filesystem
 
         cache_fs = get_cache_filesystem()
 
-        # Generate the cache key for this album
-        from .artwork_cache_service import get_artwork_cache_service
-        from ..models import Album
-
-        album = db.query(Album).filter(Album.id == album_id).first()
-        if album:
-            cache_service = get_artwork_cache_service()
-            cache_key = cache_service.generate_cache_key(album)
+        # Load cache record paths for just the albums being checked, chunked
+        # to stay below SQLite's bound parameter limit
+        candidate_paths = defaultdict(list)
+        album_ids = [album.id for album in albums]
+        for i in range(0, len(album_ids), self.UPDATE_CHUNK_SIZE):
+            chunk = album_ids[i : i + self.UPDATE_CHUNK_SIZE]
+            for album_id, file_path in db.query(
+                ArtworkCache.album_id, ArtworkCache.file_path
+            ).filter(
+                ArtworkCache.album_id.in_(chunk), ArtworkCache.file_path.isnot(None)
+            ):
+                candidate_paths[album_id].append(file_path)
+
+        for album in albums:
+            cache_key = cache_fs.generate_cache_key(album.id, album.musicbrainz_id)
+            for variant in cache_fs.SIZE_SPECS.keys():
+                candidate_paths[album.id].append(
+                    str(cache_fs.get_cache_path(cache_key, variant))
+                )
 
-            # Check if any variant exists
-            for variant in ["original", "large", "medium", "small", "thumbnail"]:
-                if cache_fs.exists(cache_key, variant):
-                    return True
+        unique_paths = list(
+            {path for paths in candidate_paths.values() for path in paths}
+        )
+        with ThreadPoolExecutor(max_workers=self.FILE_CHECK_WORKERS) as executor:
+            existing_paths = {
+                path
+                for path, exists in zip(
+                    unique_paths, executor.map(os.path.exists, unique_paths)
+                )
+                if exists
+            }
 
-        return False
+        return {
+            album_id
+            for album_id, paths in candidate_paths.items()
+            if any(path in existing_paths for path in paths)
+        }
 
     def get_stats(self) -> Dict[str, Any]:
         """Get the latest validation statistics"""
@@ -164,7 +164,7 @@ class ArtworkDownloader:
             )
 
         # Calculate checksum
-        checksum = hashlib.md5(image_data).hexdigest()
+        checksum = hashlib.blake2b(image_data, digest_size=16).hexdigest()
 
         # Build metadata
         metadata = {
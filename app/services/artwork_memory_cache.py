@@ -76,32 +76,36 @@ class ArtworkMemoryCache:
         key = self._generate_cache_key(album_id, size)
 
         with self._lock:
-            self._stats["total_requests"] += 1
-
-            # Check if key exists
-            if key not in self._cache:
-                self._stats["misses"] += 1
+            cache = self._cache
+            stats = self._stats
+            stats["total_requests"] += 1
+
+            # Single lookup covers both the existence check and the fetch
+            entry = cache.get(key)
+            if entry is None:
+                stats["misses"] += 1
                 logger.debug(f"Cache miss: {key}")
                 return None
 
-            # Get entry and check expiration
-            url, timestamp, metadata = self._cache[key]
+            # Check expiration
+            url, timestamp, metadata = entry
 
             if time.time() - timestamp > self.ttl_seconds:
                 # Entry expired
-                del self._cache[key]
+                del cache[key]
                 self._access_counts.pop(key, None)
-                self._stats["expirations"] += 1
-                self._stats["misses"] += 1
+                stats["expirations"] += 1
+                stats["misses"] += 1
                 logger.debug(f"Cache expired: {key}")
                 return None
 
             # Move to end (most recently used)
-            self._cache.move_to_end(key)
+            cache.move_to_end(key)
 
             # Update statistics
-            self._stats["hits"] += 1
-            self._access_counts[key] = self._access_counts.get(key, 0) + 1
+            stats["hits"] += 1
+            access_counts = self._access_counts
+            access_counts[key] = access_counts.get(key, 0) + 1
 
             logger.debug(f"Cache hit: {key} -> {url[:50]}...")
             return url
@@ -143,8 +147,8 @@ class ArtworkMemoryCache:
 
             logger.debug(f"Cached: {key} -> {url[:50]}...")
 
-            # Periodic cleanup
-            if time.time() - self._last_cleanup > 300:  # Every 5 minutes
+            # Periodic cleanup, reusing this write's timestamp
+            if timestamp - self._last_cleanup > 300:  # Every 5 minutes
                 self._cleanup_expired()
 
     def _cleanup_expired(self) -> int:
@@ -239,8 +243,16 @@ class ArtworkMemoryCache:
         """
         added = 0
 
-        for album_id, size, url in entries:
-            if not self.get(album_id, size):  # Only add if not already cached
+        # Insert the whole batch under one lock acquisition; checking entries
+        # directly also keeps warming out of the hit/miss statistics
+        with self._lock:
+            now = time.time()
+
+            for album_id, size, url in entries:
+                cached = self._cache.get(self._generate_cache_key(album_id, size))
+                if cached and now - cached[1] <= self.ttl_seconds:
+                    continue  # Only add if not already cached
+
                 self.set(album_id, size, url)
                 added += 1
 
@@ -4,7 +4,9 @@ Handles artwork caching and other async tasks
 """
 
 import asyncio
+import os
 import logging
+import uuid
 from typing import Optional, Dict, Any, Callable
 from datetime import datetime, timezone
 from collections import deque
@@ -19,6 +21,9 @@ class BackgroundTaskManager:
     Uses asyncio to run tasks without blocking the main application
     """
 
+    # Fallback wake-up interval for the processor when nothing signals it
+    IDLE_POLL_INTERVAL = 1.0  # seconds
+
     def __init__(self, max_concurrent_tasks: int = 3):
         """
         Initialize the background task manager
@@ -35,18 +40,24 @@ class BackgroundTaskManager:
         self._task_counter = 0
         self._shutdown = False
 
+        # Signals the processor when tasks are queued or finish
+        self._wakeup = asyncio.Event()
+        self._loop = None
+
         # Start the task processor
         self._processor_task = None
 
     async def start(self):
         """Start the background task processor"""
         if not self._processor_task:
+            self._loop = asyncio.get_running_loop()
             self._processor_task = asyncio.create_task(self._process_tasks())
             logger.info("Background task manager started")
 
     async def stop(self):
         """Stop the background task processor"""
         self._shutdown = True
+        self._wakeup.set()
         if self._processor_task:
             await self._processor_task
             logger.info("Background task manager stopped")
@@ -55,8 +66,20 @@ class BackgroundTaskManager:
         """Process tasks from the queue"""
         while not self._shutdown:
             try:
-                # Check if we have tasks to process
-                if (
+                # Clear before inspecting state so no signal is lost
+                self._wakeup.clear()
+
+                # Clean up completed tasks
+                completed = []
+                for task_id, task_data in self._running_tasks.items():
+                    if task_data["task"].done():
+                        completed.append(task_id)
+
+                for task_id in completed:
+                    del self._running_tasks[task_id]
+
+                # Start as many queued tasks as there are free slots
+                while (
                     self._task_queue
                     and len(self._running_tasks) < self.max_concurrent_tasks
                 ):
@@ -64,23 +87,20 @@ class BackgroundTaskManager:
 
                     # Create and start the task
                     task = asyncio.create_task(self._run_task(task_info))
+                    task.add_done_callback(lambda _: self._wakeup.set())
                     self._running_tasks[task_info["id"]] = {
                         "task": task,
                         "info": task_info,
                         "started_at": datetime.now(timezone.utc),
                     }
 
-                # Clean up completed tasks
-                completed = []
-                for task_id, task_data in self._running_tasks.items():
-                    if task_data["task"].done():
-                        completed.append(task_id)
-
-                for task_id in completed:
-                    del self._running_tasks[task_id]
-
-                # Sleep briefly to avoid busy waiting
-                await asyncio.sleep(0.1)
+                # Wait until a task is queued or finishes instead of polling
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=self.IDLE_POLL_INTERVAL
+                    )
+                except asyncio.TimeoutError:
+                    pass
 
             except Exception as e:
                 logger.error(f"Error in task processor: {e}")
@@ -100,9 +120,8 @@ class BackgroundTaskManager:
                 if asyncio.iscoroutinefunction(func):
                     result = await func(*args, **kwargs)
                 else:
-                    # Run sync functions in executor
-                    loop = asyncio.get_event_loop()
-                    result = await loop.run_in_executor(None, func, *args, **kwargs)
+                    # Run sync functions in a worker thread
+                    result = await asyncio.to_thread(func, *args, **kwargs)
 
                 # Record success
                 self._completed_tasks.append(
@@ -153,8 +172,7 @@ class BackgroundTaskManager:
             if asyncio.iscoroutinefunction(callback):
                 await callback(arg)
             else:
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, callback, arg)
+                await asyncio.to_thread(callback, arg)
         except Exception as e:
             logger.error(f"Error in callback: {e}")
 
@@ -186,7 +204,7 @@ class BackgroundTaskManager:
             Task ID
         """
         self._task_counter += 1
-        task_id = f"task_{self._task_counter}_{datetime.now(timezone.utc).timestamp()}"
+        task_id = f"task_{self._task_counter}_{uuid.uuid4().hex}"
 
         task_info = {
             "id": task_id,
@@ -207,6 +225,10 @@ class BackgroundTaskManager:
         else:
             self._task_queue.append(task_info)
 
+        # Wake the processor; add_task may be called from a worker thread
+        if self._loop and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
         logger.debug(f"Task {task_id} queued: {task_info['name']}")
         return task_id
 
@@ -245,7 +267,8 @@ def get_background_manager() -> BackgroundTaskManager:
     """Get the global background task manager instance"""
     global _background_manager
     if _background_manager is None:
-        _background_manager = BackgroundTaskManager()
+        max_concurrent = int(os.getenv("BACKGROUND_MAX_CONCURRENT_TASKS", "3"))
+        _background_manager = BackgroundTaskManager(max_concurrent)
     return _background_manager
 
 
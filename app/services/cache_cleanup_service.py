@@ -6,6 +6,7 @@ Automatically removes old unused cache entries based on configurable retention p
 import os
 import logging
 import json
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
@@ -13,10 +14,10 @@ from dataclasses import dataclass
 from collections import defaultdict
 
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, case, delete, func, or_
 
 from ..models import ArtworkCache, Album
-from ..database import SessionLocal
+from ..database import SessionLocal, bulk_write_pragmas
 from .artwork_cache_utils import get_cache_filesystem
 
 logger = logging.getLogger(__name__)
@@ -139,25 +140,23 @@ class CacheCleanupService:
         Args:
             retention_days: Number of days to retain
         """
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=retention_days)
-        grace_date = datetime.now(timezone.utc) - timedelta(
-            days=self.config.recently_added_grace_days
-        )
-        min_date = datetime.now(timezone.utc) - timedelta(
-            days=self.config.minimum_retention_days
-        )
+        now = datetime.now(timezone.utc)
+        cutoff_date = now - timedelta(days=retention_days)
+        grace_date = now - timedelta(days=self.config.recently_added_grace_days)
+        min_date = now - timedelta(days=self.config.minimum_retention_days)
+        # Respect minimum retention with a single bound on the indexed column
+        access_cutoff = min(cutoff_date, min_date)
 
         db = SessionLocal()
         try:
-            # Find old entries that haven't been accessed recently
+            # Find old entries that haven't been accessed recently, selecting
+            # only the columns needed to delete them
             old_entries = (
-                db.query(ArtworkCache)
+                db.query(ArtworkCache.id, ArtworkCache.file_path)
                 .filter(
                     and_(
-                        ArtworkCache.last_accessed_at < cutoff_date,
+                        ArtworkCache.last_accessed_at < access_cutoff,
                         ArtworkCache.last_fetched_at < grace_date,  # Not recently added
-                        ArtworkCache.last_accessed_at
-                        < min_date,  # Respect minimum retention
                     )
                 )
                 .limit(self.config.max_deletions_per_run)
@@ -168,6 +167,7 @@ class CacheCleanupService:
 
             deletions = 0
             bytes_freed = 0
+            deleted_ids = []
 
             for entry in old_entries:
                 self.stats["records_scanned"] += 1
@@ -194,24 +194,21 @@ class CacheCleanupService:
                             self.stats["files_deleted"] += 1
                             bytes_freed += file_size
 
-                # Delete database record
-                if not self.config.dry_run:
-                    db.delete(entry)
-                    deletions += 1
-                else:
-                    deletions += 1
-
+                # Queue database record for deletion
+                deleted_ids.append(entry.id)
+                deletions += 1
                 self.stats["records_deleted"] += 1
 
-                # Batch commit
-                if deletions % self.config.batch_size == 0:
+                # Batch commit, so each batch's rows go as soon as its files do
+                if len(deleted_ids) >= self.config.batch_size:
                     if not self.config.dry_run:
-                        db.commit()
+                        self._commit_deletions(db, deleted_ids)
+                    deleted_ids = []
                     logger.debug(f"Processed {deletions} deletions")
 
             # Final commit
-            if not self.config.dry_run:
-                db.commit()
+            if deleted_ids and not self.config.dry_run:
+                self._commit_deletions(db, deleted_ids)
 
             self.stats["bytes_freed"] += bytes_freed
 
@@ -245,45 +242,41 @@ class CacheCleanupService:
                 if record.file_path:
                     db_files.add(Path(record.file_path).name)
 
-            # Scan cache directories
-            cache_dir = Path(self.cache_fs.base_path)
             orphaned_bytes = 0
 
-            for size_dir in cache_dir.iterdir():
-                if not size_dir.is_dir():
-                    continue
+            # Files must be more than the grace period's whole days old; compare
+            # raw mtimes against one epoch cutoff instead of building datetimes
+            orphan_cutoff = (
+                time.time() - (self.config.recently_added_grace_days + 1) * 86400
+            )
 
-                for file_path in size_dir.iterdir():
-                    if not file_path.is_file():
-                        continue
+            # Scan cache directories
+            for entry in self._scan_cache_files():
+                self.stats["files_scanned"] += 1
 
-                    self.stats["files_scanned"] += 1
+                # Check if file is in database
+                if entry.name not in db_files:
+                    file_stat = entry.stat()
+                    file_size = file_stat.st_size
 
-                    # Check if file is in database
-                    if file_path.name not in db_files:
-                        file_size = file_path.stat().st_size
-                        file_age = datetime.now(timezone.utc) - datetime.fromtimestamp(
-                            file_path.stat().st_mtime, tz=timezone.utc
-                        )
-
-                        # Only delete if older than grace period
-                        if file_age.days > self.config.recently_added_grace_days:
-                            if not self.config.dry_run:
-                                try:
-                                    file_path.unlink()
-                                    logger.debug(f"Deleted orphaned file: {file_path}")
-                                except Exception as e:
-                                    logger.error(
-                                        f"Failed to delete orphaned file {file_path}: {e}"
-                                    )
-                                    self.stats["errors"].append(
-                                        f"Orphaned file deletion error: {e}"
-                                    )
-                                    continue
-
-                            self.stats["orphaned_files"] += 1
-                            self.stats["files_deleted"] += 1
-                            orphaned_bytes += file_size
+                    # Only delete if older than grace period
+                    if file_stat.st_mtime <= orphan_cutoff:
+                        if not self.config.dry_run:
+                            try:
+                                os.unlink(entry.path)
+                                logger.debug(f"Deleted orphaned file: {entry.path}")
+                            except Exception as e:
+                                logger.error(
+                                    f"Failed to delete orphaned file {entry.path}: {e}"
+                                )
+                                self.stats["errors"].append(
+                                    f"Orphaned file deletion error: {e}"
+                                )
+                                continue
+
+                        self.stats["orphaned_files"] += 1
+                        self.stats["files_deleted"] += 1
+                        orphaned_bytes += file_size
 
             self.stats["bytes_freed"] += orphaned_bytes
 
@@ -306,7 +299,9 @@ class CacheCleanupService:
 
             # Check all records with file paths
             records = (
-                db.query(ArtworkCache).filter(ArtworkCache.file_path.isnot(None)).all()
+                db.query(ArtworkCache.id, ArtworkCache.file_path)
+                .filter(ArtworkCache.file_path.isnot(None))
+                .all()
             )
 
             for record in records:
@@ -322,13 +317,12 @@ class CacheCleanupService:
             if invalid_records:
                 logger.info(f"Found {len(invalid_records)} invalid database records")
 
-                for record in invalid_records:
-                    if not self.config.dry_run:
-                        db.delete(record)
-                    self.stats["records_deleted"] += 1
+                self.stats["records_deleted"] += len(invalid_records)
 
                 if not self.config.dry_run:
-                    db.commit()
+                    self._commit_deletions(
+                        db, [record.id for record in invalid_records]
+                    )
 
                 logger.info(f"Cleaned up {len(invalid_records)} invalid records")
 
@@ -367,7 +361,11 @@ class CacheCleanupService:
         try:
             # Get LRU entries
             lru_entries = (
-                db.query(ArtworkCache)
+                db.query(
+                    ArtworkCache.id,
+                    ArtworkCache.file_path,
+                    ArtworkCache.last_fetched_at,
+                )
                 .filter(ArtworkCache.file_path.isnot(None))
                 .order_by(ArtworkCache.last_accessed_at.asc())
                 .limit(self.config.max_deletions_per_run)
@@ -375,6 +373,8 @@ class CacheCleanupService:
             )
 
             bytes_freed = 0
+            deleted_ids = []
+            now = datetime.now(timezone.utc)
 
             for entry in lru_entries:
                 if bytes_freed >= bytes_to_free:
@@ -382,7 +382,7 @@ class CacheCleanupService:
 
                 # Skip recently added items
                 if entry.last_fetched_at:
-                    age = datetime.now(timezone.utc) - entry.last_fetched_at
+                    age = now - entry.last_fetched_at
                     if age.days < self.config.recently_added_grace_days:
                         continue
 
@@ -395,7 +395,7 @@ class CacheCleanupService:
                         if not self.config.dry_run:
                             try:
                                 file_path.unlink()
-                                db.delete(entry)
+                                deleted_ids.append(entry.id)
                             except Exception as e:
                                 logger.error(f"Failed to delete {file_path}: {e}")
                                 continue
@@ -405,7 +405,7 @@ class CacheCleanupService:
                         self.stats["records_deleted"] += 1
 
             if not self.config.dry_run:
-                db.commit()
+                self._commit_deletions(db, deleted_ids)
 
             self.stats["bytes_freed"] += bytes_freed
 
@@ -420,16 +420,56 @@ class CacheCleanupService:
         finally:
             db.close()
 
+    def _delete_records(self, db: Session, record_ids: List[int]) -> None:
+        """
+        Delete cache records by ID with one DELETE statement per batch
+
+        Args:
+            db: Database session
+            record_ids: IDs of ArtworkCache records to delete
+        """
+        for i in range(0, len(record_ids), self.config.batch_size):
+            chunk = record_ids[i : i + self.config.batch_size]
+            db.execute(delete(ArtworkCache).where(ArtworkCache.id.in_(chunk)))
+            logger.debug(f"Deleted {i + len(chunk)}/{len(record_ids)} cache records")
+
+    def _commit_deletions(self, db: Session, record_ids: List[int]) -> None:
+        """
+        Delete ArtworkCache records and commit, tuned for bulk writes
+
+        All sessions share one SQLite connection, so the pragmas are held only
+        for this write and restored before any other step's work runs.
+
+        Args:
+            db: Database session
+            record_ids: IDs of ArtworkCache records to delete
+        """
+        with bulk_write_pragmas(db):
+            self._delete_records(db, record_ids)
+            db.commit()
+
+    def _scan_cache_files(self) -> List[os.DirEntry]:
+        """
+        List files in every cache size directory with one scandir per directory
+
+        Returns:
+            Directory entries for all cached files
+        """
+        files = []
+
+        with os.scandir(self.cache_fs.base_path) as size_dirs:
+            for size_dir in size_dirs:
+                if not size_dir.is_dir():
+                    continue
+
+                with os.scandir(size_dir.path) as entries:
+                    files.extend(entry for entry in entries if entry.is_file())
+
+        return files
+
     def _get_cache_size_mb(self) -> float:
         """Get total cache size in MB"""
-        cache_dir = Path(self.cache_fs.base_path)
-        total_size = 0
-
-        for size_dir in cache_dir.iterdir():
-            if size_dir.is_dir():
-                for file_path in size_dir.iterdir():
-                    if file_path.is_file():
-                        total_size += file_path.stat().st_size
+        total_size = sum(entry.stat().st_size for entry in self._scan_cache_files())
 
         return total_size / (1024 * 1024)
 
@@ -475,30 +515,20 @@ Cache Cleanup Summary:
         """
         db = SessionLocal()
         try:
-            # Get cache statistics
-            total_entries = db.query(ArtworkCache).count()
+            now = datetime.now(timezone.utc)
+            cutoff_date = now - timedelta(days=self.config.default_retention_days)
+            recent_date = now - timedelta(days=30)  # Recently accessed window
 
-            # Get old entries count
-            cutoff_date = datetime.now(timezone.utc) - timedelta(
-                days=self.config.default_retention_days
-            )
-            old_entries = (
-                db.query(ArtworkCache)
-                .filter(ArtworkCache.last_accessed_at < cutoff_date)
-                .count()
-            )
+            # Get total, old and recently accessed counts in a single query
+            total_entries, old_entries, recent_entries = db.query(
+                func.count(ArtworkCache.id),
+                func.count(case((ArtworkCache.last_accessed_at < cutoff_date, 1))),
+                func.count(case((ArtworkCache.last_accessed_at >= recent_date, 1))),
+            ).one()
 
             # Get cache size
             cache_size_mb = self._get_cache_size_mb()
 
-            # Get recently accessed count (last 30 days)
-            recent_date = datetime.now(timezone.utc) - timedelta(days=30)
-            recent_entries = (
-                db.query(ArtworkCache)
-                .filter(ArtworkCache.last_accessed_at >= recent_date)
-                .count()
-            )
-
             return {
                 "total_entries": total_entries,
                 "old_entries": old_entries,
@@ -521,7 +551,7 @@ Cache Cleanup Summary:
     def _estimate_space_to_free(self, db: Session, cutoff_date: datetime) -> float:
         """Estimate space that would be freed by cleanup"""
         old_entries = (
-            db.query(ArtworkCache)
+            db.query(ArtworkCache.file_path)
             .filter(ArtworkCache.last_accessed_at < cutoff_date)
             .all()
         )
@@ -12,10 +12,21 @@ from ..models import Album, Artist, Track, UserSettings
 
 logger = logging.getLogger(__name__)
 
+# Prefer orjson for serializing large exports, fallback to stdlib json
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class ExportService:
     """Service for exporting complete database to JSON format"""
 
+    # Rows fetched per round trip while streaming tables into the export
+    STREAM_BATCH_SIZE = 500
+
     def __init__(self):
         """Initialize the export service"""
         pass
@@ -73,7 +84,15 @@ class ExportService:
 
             # Export Artists
             logger.info("Exporting artists...")
-            artists = db.query(Artist).order_by(Artist.id).all()
+            # Only the exported columns are selected, as plain rows rather
+            # than ORM objects, to keep large exports cheap
+            artists = (
+                db.query(
+                    Artist.id, Artist.name, Artist.musicbrainz_id, Artist.created_at
+                )
+                .order_by(Artist.id)
+                .yield_per(self.STREAM_BATCH_SIZE)
+            )
             artist_map = {}  # Map old IDs to export index for reference
 
             for idx, artist in enumerate(artists):
@@ -91,7 +110,30 @@ class ExportService:
 
             # Export Albums
             logger.info("Exporting albums...")
-            albums = db.query(Album).order_by(Album.id).all()
+            albums = (
+                db.query(
+                    Album.id,
+                    Album.artist_id,
+                    Album.name,
+                    Album.release_year,
+                    Album.musicbrainz_id,
+                    Album.cover_art_url,
+                    Album.genre,
+                    Album.total_tracks,
+                    Album.total_duration_ms,
+                    Album.rating_score,
+                    Album.album_bonus,
+                    Album.is_rated,
+                    Album.notes,
+                    Album.created_at,
+                    Album.updated_at,
+                    Album.rated_at,
+                    Album.artwork_cached,
+                    Album.artwork_cache_date,
+                )
+                .order_by(Album.id)
+                .yield_per(self.STREAM_BATCH_SIZE)
+            )
             album_map = {}  # Map old IDs to export index
 
             for idx, album in enumerate(albums):
@@ -131,7 +173,21 @@ class ExportService:
 
             # Export Tracks
             logger.info("Exporting tracks...")
-            tracks = db.query(Track).order_by(Track.album_id, Track.track_number).all()
+            tracks = (
+                db.query(
+                    Track.id,
+                    Track.album_id,
+                    Track.track_number,
+                    Track.name,
+                    Track.duration_ms,
+                    Track.musicbrainz_id,
+                    Track.track_rating,
+                    Track.created_at,
+                    Track.updated_at,
+                )
+                .order_by(Track.album_id, Track.track_number)
+                .yield_per(self.STREAM_BATCH_SIZE)
+            )
 
             for track in tracks:
                 export_data["tracks"].append(
@@ -198,9 +254,9 @@ class ExportService:
             logger.error(f"Database export failed: {e}")
             return {"success": False, "error": str(e), "data": None}
 
-    def export_to_json_string(self, db: Session) -> tuple[str, str]:
+    def export_to_json_string(self, db: Session) -> tuple[bytes, str]:
         """
-        Export database and return as JSON string
+        Export database and return as UTF-8 encoded JSON
 
         Args:
             db: Database session
@@ -213,8 +269,13 @@ class ExportService:
         if not result["success"]:
             raise Exception(f"Export failed: {result.get('error', 'Unknown error')}")
 
-        # Convert to formatted JSON string
-        json_content = json.dumps(result["data"], indent=2, ensure_ascii=False)
+        # Convert to formatted JSON, encoded once straight to bytes
+        if ORJSON_AVAILABLE:
+            json_content = orjson.dumps(result["data"], option=orjson.OPT_INDENT_2)
+        else:
+            json_content = json.dumps(
+                result["data"], indent=2, ensure_ascii=False
+            ).encode("utf-8")
 
         return json_content, result["filename"]
 
@@ -378,7 +378,7 @@ class ImageProcessor:
             Dictionary of metadata
         """
         # Calculate checksum
-        checksum = hashlib.md5(output_data).hexdigest()
+        checksum = hashlib.blake2b(output_data, digest_size=16).hexdigest()
 
         metadata = {
             "variant": variant,
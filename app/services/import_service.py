@@ -7,10 +7,10 @@ import logging
 from datetime import datetime
 from typing import Dict, Any, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from sqlalchemy import insert, text
 
 from ..models import Album, Artist, Track, UserSettings
-from ..database import engine
+from ..database import engine, bulk_write_pragmas
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +93,53 @@ class ImportService:
             logger.error(f"Validation error: {str(e)}")
             return False, f"Validation error: {str(e)}"
 
+    def _album_row(
+        self, album_data: Dict[str, Any], artist_map: Dict[int, int]
+    ) -> Dict[str, Any]:
+        """
+        Build an albums table row from backup data
+
+        Args:
+            album_data: Album entry from the backup
+            artist_map: Mapping of backup artist IDs to new artist IDs
+
+        Returns:
+            Column values for a bulk insert
+        """
+        row = {
+            "name": album_data["name"],
+            "artist_id": artist_map.get(album_data["artist_id"]),
+            "release_year": album_data.get("release_year"),
+            "musicbrainz_id": album_data.get("musicbrainz_id"),
+            "cover_art_url": album_data.get("cover_art_url"),
+            "genre": album_data.get("genre"),
+            "total_tracks": album_data.get("total_tracks"),
+            "total_duration_ms": album_data.get("total_duration_ms"),
+            "rating_score": album_data.get("rating_score"),
+            "album_bonus": album_data.get("album_bonus", 0.33),
+            "is_rated": album_data.get("is_rated", False),
+            "notes": album_data.get("notes"),
+            # Using completed_at as rated_at
+            "rated_at": self._parse_datetime(album_data.get("completed_at")),
+            "artwork_cached": album_data.get("artwork_cached", False),
+            "artwork_cache_date": self._parse_datetime(
+                album_data.get("artwork_cache_date")
+            ),
+        }
+
+        # Leave created_at out when missing so the column default applies
+        created_at = self._parse_datetime(album_data.get("created_at"))
+        if created_at:
+            row["created_at"] = created_at
+
+        return row
+
+    def _parse_datetime(self, value: Optional[str]) -> Optional[datetime]:
+        """Convert an ISO datetime string from the backup to a datetime"""
+        if not value:
+            return None
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
     def import_database(
         self, db: Session, backup_data: Dict[str, Any]
     ) -> Tuple[bool, str]:
@@ -115,154 +162,156 @@ class ImportService:
             # Start transaction
             db.begin()
 
-            try:
-                # Clear existing data in correct order (respecting foreign keys)
-                logger.info("Clearing existing database")
-                db.query(Track).delete()
-                db.query(Album).delete()
-                db.query(Artist).delete()
-                db.query(UserSettings).delete()
-                db.flush()
-
-                # Import settings
-                logger.info("Importing settings")
-                settings_data = backup_data["settings"]
-                settings = UserSettings(
-                    user_id=1,  # Always use user_id=1 for now
-                    album_bonus=settings_data.get("album_bonus", 0.2),
-                    theme=settings_data.get("theme", "light"),
-                    date_format=settings_data.get("date_format", "MM/DD/YYYY"),
-                    default_sort_order=settings_data.get(
-                        "default_sort_order", "created_desc"
-                    ),
-                    auto_cache_artwork=settings_data.get("auto_cache_artwork", True),
-                    auto_migrate_artwork=settings_data.get(
-                        "auto_migrate_artwork", False
-                    ),
-                    migration_batch_size=settings_data.get("migration_batch_size", 10),
-                    cache_retention_days=settings_data.get("cache_retention_days", 365),
-                    cache_max_size_mb=settings_data.get("cache_max_size_mb", 5000),
-                    cache_cleanup_enabled=settings_data.get(
-                        "cache_cleanup_enabled", True
-                    ),
-                    cache_cleanup_time=settings_data.get("cache_cleanup_time", "03:00"),
-                )
-                db.add(settings)
-                db.flush()
-
-                # Import artists
-                logger.info(f"Importing {len(backup_data['artists'])} artists")
-                artist_map = {}  # Map old IDs to new IDs
-                for artist_data in backup_data["artists"]:
-                    artist = Artist(
-                        name=artist_data["name"],
-                        musicbrainz_id=artist_data.get("musicbrainz_id"),
-                    )
-                    db.add(artist)
+            # Tune SQLite for the bulk load, restoring settings afterwards
+            with bulk_write_pragmas(db):
+                try:
+                    # Clear existing data in correct order (respecting foreign keys)
+                    logger.info("Clearing existing database")
+                    db.query(Track).delete()
+                    db.query(Album).delete()
+                    db.query(Artist).delete()
+                    db.query(UserSettings).delete()
                     db.flush()
-                    artist_map[artist_data["id"]] = artist.id
-
-                # Import albums
-                logger.info(f"Importing {len(backup_data['albums'])} albums")
-                album_map = {}  # Map old IDs to new IDs
-                for album_data in backup_data["albums"]:
-                    # Convert datetime strings to datetime objects
-                    created_at = None
-                    if album_data.get("created_at"):
-                        created_at = datetime.fromisoformat(
-                            album_data["created_at"].replace("Z", "+00:00")
-                        )
-
-                    completed_at = None
-                    if album_data.get("completed_at"):
-                        completed_at = datetime.fromisoformat(
-                            album_data["completed_at"].replace("Z", "+00:00")
-                        )
-
-                    album = Album(
-                        name=album_data["name"],
-                        artist_id=artist_map.get(album_data["artist_id"]),
-                        release_year=album_data.get("release_year"),
-                        musicbrainz_id=album_data.get("musicbrainz_id"),
-                        cover_art_url=album_data.get("cover_art_url"),
-                        genre=album_data.get("genre"),
-                        total_tracks=album_data.get("total_tracks"),
-                        total_duration_ms=album_data.get("total_duration_ms"),
-                        rating_score=album_data.get("rating_score"),
-                        album_bonus=album_data.get("album_bonus", 0.33),
-                        is_rated=album_data.get("is_rated", False),
-                        notes=album_data.get("notes"),
-                        created_at=created_at,
-                        rated_at=completed_at,  # Using completed_at as rated_at
-                        artwork_cached=album_data.get("artwork_cached", False),
-                        artwork_cache_date=(
-                            datetime.fromisoformat(
-                                album_data["artwork_cache_date"].replace("Z", "+00:00")
-                            )
-                            if album_data.get("artwork_cache_date")
-                            else None
+
+                    # Import settings
+                    logger.info("Importing settings")
+                    settings_data = backup_data["settings"]
+                    settings = UserSettings(
+                        user_id=1,  # Always use user_id=1 for now
+                        album_bonus=settings_data.get("album_bonus", 0.2),
+                        theme=settings_data.get("theme", "light"),
+                        date_format=settings_data.get("date_format", "MM/DD/YYYY"),
+                        default_sort_order=settings_data.get(
+                            "default_sort_order", "created_desc"
+                        ),
+                        auto_cache_artwork=settings_data.get(
+                            "auto_cache_artwork", True
+                        ),
+                        auto_migrate_artwork=settings_data.get(
+                            "auto_migrate_artwork", False
+                        ),
+                        migration_batch_size=settings_data.get(
+                            "migration_batch_size", 10
+                        ),
+                        cache_retention_days=settings_data.get(
+                            "cache_retention_days", 365
+                        ),
+                        cache_max_size_mb=settings_data.get("cache_max_size_mb", 5000),
+                        cache_cleanup_enabled=settings_data.get(
+                            "cache_cleanup_enabled", True
+                        ),
+                        cache_cleanup_time=settings_data.get(
+                            "cache_cleanup_time", "03:00"
                         ),
                     )
-                    db.add(album)
+                    db.add(settings)
                     db.flush()
-                    album_map[album_data["id"]] = album.id
-
-                # Import tracks
-                logger.info(f"Importing {len(backup_data['tracks'])} tracks")
-                for track_data in backup_data["tracks"]:
-                    track = Track(
-                        name=track_data["name"],
-                        album_id=album_map.get(track_data["album_id"]),
-                        track_number=track_data["track_number"],
-                        duration_ms=track_data.get("duration_ms"),
-                        track_rating=track_data.get("track_rating"),
-                        musicbrainz_id=track_data.get("musicbrainz_id"),
-                    )
-                    db.add(track)
-
-                # Commit transaction
-                db.commit()
-
-                # Reset sequences for SQLite
-                if "sqlite" in str(engine.url):
-                    logger.info("Resetting SQLite sequences")
-                    try:
-                        # Check if sqlite_sequence table exists
-                        result = db.execute(
-                            text(
-                                "SELECT name FROM sqlite_master WHERE type='table' AND name='sqlite_sequence'"
+
+                    # Import artists
+                    logger.info(f"Importing {len(backup_data['artists'])} artists")
+                    artist_rows = [
+                        {
+                            "name": artist_data["name"],
+                            "musicbrainz_id": artist_data.get("musicbrainz_id"),
+                        }
+                        for artist_data in backup_data["artists"]
+                    ]
+                    artist_map = {}  # Map old IDs to new IDs
+                    if artist_rows:
+                        new_artist_ids = db.scalars(
+                            insert(Artist).returning(
+                                Artist.id, sort_by_parameter_order=True
+                            ),
+                            artist_rows,
+                        ).all()
+                        artist_map = {
+                            artist_data["id"]: new_id
+                            for artist_data, new_id in zip(
+                                backup_data["artists"], new_artist_ids
                             )
-                        )
-                        if result.fetchone():
-                            db.execute(text("DELETE FROM sqlite_sequence"))
-                            db.execute(
-                                text(
-                                    f"INSERT INTO sqlite_sequence (name, seq) VALUES ('artists', {len(backup_data['artists'])})"
-                                )
+                        }
+
+                    # Import albums in a single executemany, returning new IDs in
+                    # parameter order so old IDs can be mapped without per-row flushes
+                    logger.info(f"Importing {len(backup_data['albums'])} albums")
+                    album_rows = [
+                        self._album_row(album_data, artist_map)
+                        for album_data in backup_data["albums"]
+                    ]
+                    album_map = {}  # Map old IDs to new IDs
+                    if album_rows:
+                        new_album_ids = db.scalars(
+                            insert(Album).returning(
+                                Album.id, sort_by_parameter_order=True
+                            ),
+                            album_rows,
+                        ).all()
+                        album_map = {
+                            album_data["id"]: new_id
+                            for album_data, new_id in zip(
+                                backup_data["albums"], new_album_ids
                             )
-                            db.execute(
+                        }
+
+                    # Import tracks
+                    logger.info(f"Importing {len(backup_data['tracks'])} tracks")
+                    track_rows = [
+                        {
+                            "name": track_data["name"],
+                            "album_id": album_map.get(track_data["album_id"]),
+                            "track_number": track_data["track_number"],
+                            "duration_ms": track_data.get("duration_ms"),
+                            "track_rating": track_data.get("track_rating"),
+                            "musicbrainz_id": track_data.get("musicbrainz_id"),
+                        }
+                        for track_data in backup_data["tracks"]
+                    ]
+                    if track_rows:
+                        db.execute(insert(Track), track_rows)
+
+                    # Commit transaction
+                    db.commit()
+
+                    # Reset sequences for SQLite
+                    if "sqlite" in str(engine.url):
+                        logger.info("Resetting SQLite sequences")
+                        try:
+                            # Check if sqlite_sequence table exists
+                            result = db.execute(
                                 text(
-                                    f"INSERT INTO sqlite_sequence (name, seq) VALUES ('albums', {len(backup_data['albums'])})"
+                                    "SELECT name FROM sqlite_master WHERE type='table' AND name='sqlite_sequence'"
                                 )
                             )
-                            db.execute(
-                                text(
-                                    f"INSERT INTO sqlite_sequence (name, seq) VALUES ('tracks', {len(backup_data['tracks'])})"
+                            if result.fetchone():
+                                db.execute(text("DELETE FROM sqlite_sequence"))
+                                db.execute(
+                                    text(
+                                        f"INSERT INTO sqlite_sequence (name, seq) VALUES ('artists', {len(backup_data['artists'])})"
+                                    )
                                 )
-                            )
-                            db.commit()
-                    except Exception as e:
-                        logger.warning(f"Could not reset SQLite sequences: {e}")
-
-                message = f"Successfully imported {len(backup_data['artists'])} artists, {len(backup_data['albums'])} albums, and {len(backup_data['tracks'])} tracks"
-                logger.info(message)
-                return True, message
-
-            except Exception as e:
-                # Rollback on any error
-                db.rollback()
-                logger.error(f"Import failed, rolling back: {str(e)}")
-                return False, f"Import failed: {str(e)}"
+                                db.execute(
+                                    text(
+                                        f"INSERT INTO sqlite_sequence (name, seq) VALUES ('albums', {len(backup_data['albums'])})"
+                                    )
+                                )
+                                db.execute(
+                                    text(
+                                        f"INSERT INTO sqlite_sequence (name, seq) VALUES ('tracks', {len(backup_data['tracks'])})"
+                                    )
+                                )
+                                db.commit()
+                        except Exception as e:
+                            logger.warning(f"Could not reset SQLite sequences: {e}")
+
+                    message = f"Successfully imported {len(backup_data['artists'])} artists, {len(backup_data['albums'])} albums, and {len(backup_data['tracks'])} tracks"
+                    logger.info(message)
+                    return True, message
+
+                except Exception as e:
+                    # Rollback on any error
+                    db.rollback()
+                    logger.error(f"Import failed, rolling back: {str(e)}")
+                    return False, f"Import failed: {str(e)}"
 
         except Exception as e:
             logger.error(f"Import error: {str(e)}")
@@ -382,7 +382,7 @@ class ScheduledTaskManager:
         result = cleanup_service.cleanup()
 
         # Save result to scheduled task log
-        self._save_task_result("cache_cleanup", result)
+        await self._save_task_result("cache_cleanup", result)
 
         return result
 
@@ -401,7 +401,7 @@ class ScheduledTaskManager:
             "memory_freed_mb": stats_before["memory"]["mb_total"],
         }
 
-        self._save_task_result("memory_cache_clear", result)
+        await self._save_task_result("memory_cache_clear", result)
 
         logger.info(
             f"Cleared memory cache: {result['entries_cleared']} entries, {result['memory_freed_mb']:.2f} MB"
@@ -427,7 +427,7 @@ class ScheduledTaskManager:
         reports["background_tasks"] = self.background_manager.get_status()
 
         # Save report
-        self._save_task_result("weekly_report", reports)
+        await self._save_task_result("weekly_report", reports)
 
         logger.info("Generated weekly reports")
 
@@ -446,7 +446,7 @@ class ScheduledTaskManager:
         )
 
         # Save result
-        self._save_task_result("integrity_check", result)
+        await self._save_task_result("integrity_check", result)
 
         logger.info(
             f"Integrity check completed: score={result['integrity_score']}%, "
@@ -464,7 +464,7 @@ class ScheduledTaskManager:
         result = integrity_service.quick_check()
 
         # Save result
-        self._save_task_result("integrity_quick_check", result)
+        await self._save_task_result("integrity_quick_check", result)
 
         logger.info(
             f"Quick integrity check: estimated score={result['estimated_integrity_score']}%"
@@ -479,8 +479,15 @@ class ScheduledTaskManager:
 
         return result
 
-    def _save_task_result(self, task_name: str, result: Dict[str, Any]):
-        """Save task result to file"""
+    async def _save_task_result(self, task_name: str, result: Dict[str, Any]):
+        """Save task result to file without blocking the scheduler loop"""
+        result_file = await asyncio.to_thread(
+            self._write_task_result, task_name, result
+        )
+        logger.debug(f"Task result saved to {result_file}")
+
+    def _write_task_result(self, task_name: str, result: Dict[str, Any]) -> Path:
+        """Serialize a task result to the scheduled task log directory"""
         results_dir = Path("logs/scheduled_tasks")
         results_dir.mkdir(parents=True, exist_ok=True)
 
@@ -490,7 +497,7 @@ class ScheduledTaskManager:
         with open(result_file, "w") as f:
             json.dump(result, f, indent=2, default=str)
 
-        logger.debug(f"Task result saved to {result_file}")
+        return result_file
 
     def get_status(self) -> Dict[str, Any]:
         """Get scheduled tasks status"""
@@ -21,6 +21,16 @@ class ArtworkURLResolver:
     Provides template functions for getting cached or external artwork URLs
     """
 
+    # Map size names to standard variants
+    SIZE_MAP = {
+        "thumb": "thumbnail",
+        "small": "small",
+        "medium": "medium",
+        "large": "large",
+        "original": "original",
+        "thumbnail": "thumbnail",
+    }
+
     def __init__(self):
         """Initialize the artwork URL resolver"""
         self.cache_service = get_artwork_cache_service()
@@ -109,17 +119,7 @@ class ArtworkURLResolver:
                     memory_cache.set(album_id, size, cached_entry["url"])
                     return cached_entry["url"]
 
-            # Map size names to standard variants
-            size_map = {
-                "thumb": "thumbnail",
-                "small": "small",
-                "medium": "medium",
-                "large": "large",
-                "original": "original",
-                "thumbnail": "thumbnail",
-            }
-
-            normalized_size = size_map.get(size.lower(), "medium")
+            normalized_size = self.SIZE_MAP.get(size.lower(), "medium")
 
             # Try to get from database cache
             with SessionLocal() as db:
@@ -181,6 +181,55 @@ class ArtworkURLResolver:
             self.stats["errors"] += 1
             return fallback or "/static/img/album-placeholder.svg"
 
+    def prefetch_artwork_urls(self, albums, size: str = "medium") -> int:
+        """
+        Load cached artwork paths for a list of albums with a single query
+
+        Call before resolving URLs for many albums so each get_artwork_url
+        call is served from the memory cache instead of opening its own
+        database session.
+
+        Args:
+            albums: Album model instances or dicts with album data
+            size: Size variant (thumbnail, small, medium, large, original)
+
+        Returns:
+            Number of URLs loaded into the memory cache
+        """
+        album_ids = [
+            album.get("id") if isinstance(album, dict) else album.id
+            for album in albums
+            if album
+        ]
+        album_ids = [album_id for album_id in album_ids if album_id]
+        if not album_ids:
+            return 0
+
+        from .services.artwork_memory_cache import get_artwork_memory_cache
+
+        memory_cache = get_artwork_memory_cache()
+        normalized_size = self.SIZE_MAP.get(size.lower(), "medium")
+
+        try:
+            with SessionLocal() as db:
+                cache_records = (
+                    db.query(ArtworkCache.album_id, ArtworkCache.file_path)
+                    .filter(
+                        ArtworkCache.album_id.in_(album_ids),
+                        ArtworkCache.size_variant == normalized_size,
+                        ArtworkCache.file_path.isnot(None),
+                    )
+                    .all()
+                )
+        except Exception as e:
+            logger.error(f"Error prefetching artwork URLs: {e}")
+            return 0
+
+        for album_id, file_path in cache_records:
+            memory_cache.set(album_id, normalized_size, self._build_web_path(file_path))
+
+        return len(cache_records)
+
     def get_artwork_url_async(
         self, album: Album, size: str = "medium", db: Session = None
     ) -> str:
@@ -397,6 +446,21 @@ def get_artwork_url(album, size: str = "medium", fallback: Optional[str] = None)
     return resolver.get_artwork_url(album, size, fallback)
 
 
+def prefetch_artwork_urls(albums, size: str = "medium") -> int:
+    """
+    Preload cached artwork URLs for albums about to be rendered together
+
+    Args:
+        albums: Album model instances or dicts
+        size: Size variant (thumbnail, small, medium, large, original)
+
+    Returns:
+        Number of URLs loaded into the memory cache
+    """
+    resolver = get_artwork_resolver()
+    return resolver.prefetch_artwork_urls(albums, size)
+
+
 def get_cache_stats() -> Dict[str, Any]:
     """
     Get cache statistics for monitoring